@@ -1,13 +1,14 @@
 # pyright: reportGeneralTypeIssues=false
 from contextlib import asynccontextmanager
-from typing import AsyncIterator, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 import pendulum
 import uvicorn
 from fastapi import FastAPI
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.inmemory import InMemoryBackend
-from fastapi_cache.decorator import cache
+from fastapi_cache.decorator import cache, cache_invalidator
+from fastapi_cache.tag_provider import TagProvider, default_items_provider
 from pydantic import BaseModel
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
@@ -136,5 +137,34 @@ def namespaced_injection(
     }
 
 
+# tag cached responses with the files they contain, so that deleting a file
+# invalidates every cached response listing it
+file_tag_provider = TagProvider("file")
+
+# records are stored in their response shape, so listing them on a cache miss
+# does not build a new dict per file
+files: Dict[int, Dict[str, Any]] = {
+    1: {"id": 1, "value": [1, 2, 3]},
+    2: {"id": 2, "value": [4, 5, 6]},
+    3: {"id": 3, "value": [7, 8, 9]},
+}
+
+
+@app.get("/files")
+@cache(
+    namespace="test",
+    expire=5,
+    tag_providers=[(file_tag_provider, default_items_provider)],
+)
+async def get_files():
+    return list(files.values())
+
+
+@app.delete("/files/{file_id}")
+@cache_invalidator(file_tag_provider, "file_id")
+async def delete_file(file_id: int):
+    files.pop(file_id, None)
+
+
 if __name__ == "__main__":
     uvicorn.run("main:app", reload=True)
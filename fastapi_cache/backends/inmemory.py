@@ -1,7 +1,7 @@
 import time
 from asyncio import Lock
 from dataclasses import dataclass
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Sequence, Set, Tuple
 
 from fastapi_cache.types import Backend
 
@@ -12,8 +12,15 @@ class Value:
     ttl_ts: int
 
 
+@dataclass
+class Members:
+    keys: Set[str]
+    ttl_ts: int
+
+
 class InMemoryBackend(Backend):
     _store: Dict[str, Value] = {}
+    _members: Dict[str, Members] = {}
     _lock = Lock()
 
     @property
@@ -29,6 +36,15 @@ class InMemoryBackend(Backend):
                 return v
         return None
 
+    def _get_members(self, key: str) -> Optional[Members]:
+        m = self._members.get(key)
+        if m:
+            if m.ttl_ts < self._now:
+                del self._members[key]
+            else:
+                return m
+        return None
+
     async def get_with_ttl(self, key: str) -> Tuple[int, Optional[bytes]]:
         async with self._lock:
             v = self._get(key)
@@ -47,6 +63,35 @@ class InMemoryBackend(Backend):
         async with self._lock:
             self._store[key] = Value(value, self._now + (expire or 0))
 
+    def _append(self, key: str, member: str, ttl_ts: int) -> None:
+        m = self._get_members(key)
+        if m:
+            m.keys.add(member)
+            # a tag must outlive every key it holds, so never shorten its ttl
+            m.ttl_ts = max(m.ttl_ts, ttl_ts)
+        else:
+            self._members[key] = Members({member}, ttl_ts)
+
+    async def append(self, key: str, member: str, expire: Optional[int] = None) -> None:
+        async with self._lock:
+            self._append(key, member, self._now + (expire or 0))
+
+    async def bulk_append(
+        self, items: Sequence[Tuple[str, str]], expire: Optional[int] = None
+    ) -> None:
+        async with self._lock:
+            ttl_ts = self._now + (expire or 0)
+            for key, member in items:
+                self._append(key, member, ttl_ts)
+
+    async def pop_members(self, key: str) -> Set[str]:
+        async with self._lock:
+            m = self._get_members(key)
+            if m:
+                del self._members[key]
+                return m.keys
+            return set()
+
     async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
         count = 0
         if namespace:
@@ -55,7 +100,23 @@ class InMemoryBackend(Backend):
                 if key.startswith(namespace):
                     del self._store[key]
                     count += 1
+            keys = list(self._members.keys())
+            for key in keys:
+                if key.startswith(namespace):
+                    del self._members[key]
+                    count += 1
         elif key:
-            del self._store[key]
-            count += 1
+            if self._store.pop(key, None) is not None:
+                count += 1
+            if self._members.pop(key, None) is not None:
+                count += 1
+        return count
+
+    async def clear_many(self, *keys: str) -> int:
+        count = 0
+        for key in keys:
+            if self._store.pop(key, None) is not None:
+                count += 1
+            if self._members.pop(key, None) is not None:
+                count += 1
         return count
@@ -1,15 +1,40 @@
-from typing import Optional, Tuple, Union
+from typing import Optional, Sequence, Set, Tuple, Union
 
 from redis.asyncio.client import Redis
 from redis.asyncio.cluster import RedisCluster
+from redis.exceptions import NoScriptError
 
 from fastapi_cache.types import Backend
 
+# Add ARGV[1] to the set at KEYS[1] without ever shortening its ttl, as the set
+# must outlive every key it holds. An expire of 0 means the member never expires.
+APPEND_LUA = """
+local ttl = redis.call('TTL', KEYS[1])
+local expire = tonumber(ARGV[2])
+redis.call('SADD', KEYS[1], ARGV[1])
+if expire == 0 then
+    redis.call('PERSIST', KEYS[1])
+elseif ttl == -2 or (ttl >= 0 and ttl < expire) then
+    redis.call('EXPIRE', KEYS[1], expire)
+end
+"""
+
+# Atomically read and remove the set at KEYS[1]; touching only KEYS[1] keeps it
+# valid on Redis Cluster, where a MULTI pipeline is not available.
+POP_MEMBERS_LUA = """
+local members = redis.call('SMEMBERS', KEYS[1])
+redis.call('UNLINK', KEYS[1])
+return members
+"""
+
 
 class RedisBackend(Backend):
     def __init__(self, redis: Union["Redis[bytes]", "RedisCluster[bytes]"]):
         self.redis = redis
         self.is_cluster: bool = isinstance(redis, RedisCluster)
+        # run through EVALSHA, so the script bodies are only sent when not yet loaded
+        self._append_script = redis.register_script(APPEND_LUA)
+        self._pop_members_script = redis.register_script(POP_MEMBERS_LUA)
 
     async def get_with_ttl(self, key: str) -> Tuple[int, Optional[bytes]]:
         async with self.redis.pipeline(transaction=not self.is_cluster) as pipe:
@@ -21,6 +46,34 @@ class RedisBackend(Backend):
     async def set(self, key: str, value: bytes, expire: Optional[int] = None) -> None:
         await self.redis.set(key, value, ex=expire)  # type: ignore[union-attr]
 
+    async def append(self, key: str, member: str, expire: Optional[int] = None) -> None:
+        await self._append_script(keys=[key], args=[member, expire or 0])
+
+    async def _bulk_append(
+        self, items: Sequence[Tuple[str, str]], expire: Optional[int]
+    ) -> None:
+        async with self.redis.pipeline(transaction=not self.is_cluster) as pipe:
+            for key, member in items:
+                await self._append_script(
+                    keys=[key], args=[member, expire or 0], client=pipe  # type: ignore[arg-type]
+                )
+            await pipe.execute()  # type: ignore[union-attr]
+
+    async def bulk_append(
+        self, items: Sequence[Tuple[str, str]], expire: Optional[int] = None
+    ) -> None:
+        try:
+            await self._bulk_append(items, expire)
+        except NoScriptError:
+            # unlike regular pipelines, cluster pipelines do not preload scripts;
+            # load it on every primary and retry, appending is idempotent
+            await self.redis.script_load(APPEND_LUA)
+            await self._bulk_append(items, expire)
+
+    async def pop_members(self, key: str) -> Set[str]:
+        members = await self._pop_members_script(keys=[key])
+        return {member.decode() for member in members}
+
     async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
         if namespace:
             lua = f"for i, name in ipairs(redis.call('KEYS', '{namespace}:*')) do redis.call('DEL', name); end"
@@ -28,3 +81,8 @@ class RedisBackend(Backend):
         elif key:
             return await self.redis.delete(key)  # type: ignore[union-attr]
         return 0
+
+    async def clear_many(self, *keys: str) -> int:
+        if not keys:
+            return 0
+        return await self.redis.unlink(*keys)  # type: ignore[union-attr,no-any-return]
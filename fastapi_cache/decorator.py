@@ -1,12 +1,23 @@
+import asyncio
 import logging
 import sys
 from functools import wraps
-from inspect import Parameter, Signature, isawaitable, iscoroutinefunction
+from inspect import (
+    Parameter,
+    Signature,
+    isawaitable,
+    iscoroutinefunction,
+    signature,
+)
 from typing import (
+    Any,
     Awaitable,
     Callable,
     List,
     Optional,
+    Sequence,
+    Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
@@ -29,6 +40,11 @@ from starlette.status import HTTP_304_NOT_MODIFIED
 
 from fastapi_cache import FastAPICache
 from fastapi_cache.coder import Coder
+from fastapi_cache.tag_provider import (
+    ItemsProvider,
+    TagProvider,
+    check_tag_support,
+)
 from fastapi_cache.types import KeyBuilder
 
 logger: logging.Logger = logging.getLogger(__name__)
@@ -36,6 +52,11 @@ logger.addHandler(logging.NullHandler())
 P = ParamSpec("P")
 R = TypeVar("R")
 
+# upper bound on invalidations running in the background; beyond it they run inline
+MAX_BACKGROUND_INVALIDATIONS = 64
+# strong references to background invalidations, so they are not garbage collected
+_background_invalidations: "Set[asyncio.Task[None]]" = set()
+
 
 def _augment_signature(signature: Signature, *extra: Parameter) -> Signature:
     if not extra:
@@ -90,9 +111,11 @@ def cache(
     key_builder: Optional[KeyBuilder] = None,
     namespace: str = "",
     injected_dependency_namespace: str = "__fastapi_cache",
+    tag_providers: Optional[Sequence[Tuple[TagProvider, ItemsProvider]]] = None,
 ) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[Union[R, Response]]]]:
     """
     cache all function
+    :param tag_providers:
     :param injected_dependency_namespace:
     :param namespace:
     :param expire:
@@ -161,6 +184,8 @@ def cache(
             key_builder = key_builder or FastAPICache.get_key_builder()
             backend = FastAPICache.get_backend()
             cache_status_header = FastAPICache.get_cache_status_header()
+            if tag_providers:
+                check_tag_support(backend)
 
             cache_key = key_builder(
                 func,
@@ -195,6 +220,17 @@ def cache(
                         exc_info=True,
                     )
 
+                for tag_provider, items_provider in tag_providers or ():
+                    try:
+                        await tag_provider.provide(
+                            result, cache_key, expire, items_provider
+                        )
+                    except Exception:
+                        logger.warning(
+                            f"Error tagging cache key '{cache_key}' in backend:",
+                            exc_info=True,
+                        )
+
                 if response:
                     response.headers.update(
                         {
@@ -229,3 +265,64 @@ def cache(
         return inner
 
     return wrapper
+
+
+async def _invalidate(tag_provider: TagProvider, object_id: str) -> None:
+    try:
+        await tag_provider.invalidate(object_id)
+    except Exception:
+        logger.warning(
+            f"Error invalidating {tag_provider.object_type} '{object_id}' in backend:",
+            exc_info=True,
+        )
+
+
+def cache_invalidator(
+    tag_provider: TagProvider,
+    object_id_param: str,
+    background: bool = False,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """
+    invalidate cached responses tagged with an object once the function returns
+    :param tag_provider: provider the cached responses were tagged with
+    :param object_id_param: name of the function parameter holding the object id
+    :param background: return without waiting for the invalidation to finish;
+        a client reading right after may still get the stale cached response
+
+    :return:
+    """
+
+    def wrapper(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        func_signature = signature(func)
+        if object_id_param not in func_signature.parameters:
+            raise ValueError(
+                f"{func.__qualname__}() has no parameter named '{object_id_param}'"
+            )
+
+        @wraps(func)
+        async def inner(*args: P.args, **kwargs: P.kwargs) -> R:
+            bound = func_signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            object_id: Any = bound.arguments[object_id_param]
+            check_tag_support(FastAPICache.get_backend())
+
+            if iscoroutinefunction(func):
+                result = await func(*args, **kwargs)
+            else:
+                result = await run_in_threadpool(func, *args, **kwargs)  # type: ignore[arg-type]
+
+            invalidation = _invalidate(tag_provider, f"{object_id}")
+            if (
+                background
+                and len(_background_invalidations) < MAX_BACKGROUND_INVALIDATIONS
+            ):
+                task = asyncio.ensure_future(invalidation)
+                _background_invalidations.add(task)
+                task.add_done_callback(_background_invalidations.discard)
+            else:
+                await invalidation
+            return result
+
+        return inner
+
+    return wrapper
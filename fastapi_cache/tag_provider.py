@@ -0,0 +1,125 @@
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Callable, Iterable, Optional
+
+from fastapi_cache import FastAPICache
+from fastapi_cache.types import Backend
+
+ItemsProvider = Callable[[Any], Iterable[Any]]
+ObjectIdProvider = Callable[[Any], str]
+
+_get_id = itemgetter("id")
+
+# number of items whose tags are written per bulk_append call
+TAG_BATCH_SIZE = 256
+
+
+def default_items_provider(data: Any) -> Iterable[Any]:
+    """Treat a list or tuple result as a collection of items, anything else as a single item"""
+    if isinstance(data, (list, tuple)):
+        return data  # pyright: ignore[reportUnknownVariableType]
+    return (data,)
+
+
+def default_object_id_provider(item: Any) -> str:
+    return str(item["id"])
+
+
+def check_tag_support(backend: Backend) -> None:
+    """Raise if the backend cannot store tags
+
+    Tagging errors are otherwise only logged, which would leave responses
+    cached on a backend like Memcached silently never invalidated.
+
+    """
+    cls = type(backend)
+    if cls.append is Backend.append or cls.pop_members is Backend.pop_members:
+        raise NotImplementedError(
+            f"{cls.__name__} does not support tags, it must implement append and pop_members"
+        )
+
+
+class TagProvider:
+    """Tag cached responses with the objects they contain
+
+    Every cache key written by `@cache(tag_providers=...)` is recorded in a
+    backend-side set per object, so that `invalidate` can clear all cached
+    responses containing that object.
+
+    Usage:
+        >> file_tag_provider = TagProvider("file")
+        >> @cache(tag_providers=[(file_tag_provider, default_items_provider)])
+        >> async def get_files(): ...
+        >> await file_tag_provider.invalidate(file_id)
+
+    """
+
+    __slots__ = (
+        "object_type",
+        "object_id_provider",
+        "_fast_path",
+        "_prefix",
+        "_make_tag",
+    )
+
+    def __init__(
+        self,
+        object_type: str,
+        object_id_provider: ObjectIdProvider = default_object_id_provider,
+    ) -> None:
+        self.object_type = object_type
+        self.object_id_provider = object_id_provider
+        # ids from the default provider can be collected without a Python call per item
+        self._fast_path = object_id_provider is default_object_id_provider
+        # built on first use, as providers are usually created before
+        # FastAPICache.init, and rebuilt whenever it is re-initialised
+        # with another prefix
+        self._prefix: Optional[str] = None
+        self._make_tag: Optional[Callable[[str], str]] = None
+
+    def _get_tag_builder(self) -> Callable[[str], str]:
+        """Return a function prepending this provider's constant prefix to an object id"""
+        prefix = FastAPICache.get_prefix()
+        if self._make_tag is None or prefix != self._prefix:
+            self._make_tag = f"{prefix}:invalidation:{self.object_type}:".__add__
+            self._prefix = prefix
+        return self._make_tag
+
+    def get_tag(self, item: Any = None, object_id: Optional[str] = None) -> str:
+        if object_id is None:
+            object_id = self.object_id_provider(item)
+        return self._get_tag_builder()(object_id)
+
+    async def provide(
+        self,
+        data: Any,
+        parent_key: str,
+        expire: Optional[int] = None,
+        items_provider: ItemsProvider = default_items_provider,
+    ) -> None:
+        backend = FastAPICache.get_backend()
+        make_tag = self._get_tag_builder()
+        items = iter(items_provider(data))
+        while True:
+            batch = islice(items, TAG_BATCH_SIZE)
+            # list responses often contain the same object more than once
+            if self._fast_path:
+                unique_tags = set(map(make_tag, map(str, map(_get_id, batch))))
+            else:
+                unique_tags = {
+                    make_tag(self.object_id_provider(item)) for item in batch
+                }
+            if not unique_tags:
+                break
+            await backend.bulk_append(
+                [(tag, parent_key) for tag in unique_tags], expire
+            )
+
+    async def invalidate(self, object_id: str) -> None:
+        backend = FastAPICache.get_backend()
+        tag = self.get_tag(object_id=object_id)
+        # popping the tag in the same step as reading it means a response
+        # tagged concurrently either gets cleared here or keeps its tag
+        keys = await backend.pop_members(tag)
+        if keys:
+            await backend.clear_many(*keys)
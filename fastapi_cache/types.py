@@ -1,5 +1,15 @@
 import abc
-from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 from starlette.requests import Request
 from starlette.responses import Response
@@ -38,3 +48,25 @@ class Backend(abc.ABC):
     @abc.abstractmethod
     async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
         raise NotImplementedError
+
+    async def clear_many(self, *keys: str) -> int:
+        """Delete all given keys, in as few round-trips as the backend allows"""
+        count = 0
+        for key in keys:
+            count += await self.clear(key=key)
+        return count
+
+    async def append(self, key: str, member: str, expire: Optional[int] = None) -> None:
+        """Atomically add member to the set stored at key"""
+        raise NotImplementedError
+
+    async def bulk_append(
+        self, items: Sequence[Tuple[str, str]], expire: Optional[int] = None
+    ) -> None:
+        """Add each (key, member) pair, in as few round-trips as the backend allows"""
+        for key, member in items:
+            await self.append(key, member, expire)
+
+    async def pop_members(self, key: str) -> Set[str]:
+        """Atomically remove the set stored at key and return its members"""
+        raise NotImplementedError
@@ -0,0 +1,131 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.types import Backend
+
+
+@pytest.fixture()
+def clock(monkeypatch: pytest.MonkeyPatch) -> List[int]:
+    """Freeze InMemoryBackend's clock; advance it by changing clock[0]"""
+    now = [1_000_000]
+    monkeypatch.setattr(InMemoryBackend, "_now", property(lambda self: now[0]))  # pyright: ignore[reportUnknownLambdaType,reportUnknownArgumentType]
+    return now
+
+
+def test_inmemory_append_never_shortens_ttl(clock: List[int]) -> None:
+    backend = InMemoryBackend()
+
+    async def run() -> None:
+        await backend.set("mixed:long", b"x", 300)
+        await backend.append("mixed:tag", "mixed:long", 300)
+        # a shorter-lived response re-tagging the same object
+        await backend.set("mixed:short", b"y", 5)
+        await backend.bulk_append([("mixed:tag", "mixed:short")], 5)
+
+        clock[0] += 10
+        assert await backend.pop_members("mixed:tag") == {"mixed:long", "mixed:short"}
+
+    asyncio.run(run())
+
+
+def test_inmemory_append_and_pop_members(clock: List[int]) -> None:
+    backend = InMemoryBackend()
+
+    async def run() -> None:
+        await backend.append("members:a", "key1", 60)
+        await backend.append("members:a", "key1", 60)
+        await backend.bulk_append([("members:a", "key2"), ("members:b", "key1")], 60)
+
+        assert await backend.pop_members("members:a") == {"key1", "key2"}
+        # popping removes the set
+        assert await backend.pop_members("members:a") == set()
+        assert await backend.pop_members("members:b") == {"key1"}
+        assert await backend.pop_members("members:missing") == set()
+
+    asyncio.run(run())
+
+
+def test_inmemory_members_expire(clock: List[int]) -> None:
+    backend = InMemoryBackend()
+
+    async def run() -> None:
+        await backend.append("expiring:tag", "key1", 5)
+        clock[0] += 6
+        assert await backend.pop_members("expiring:tag") == set()
+        assert "expiring:tag" not in InMemoryBackend._members  # pyright: ignore[reportPrivateUsage]
+
+    asyncio.run(run())
+
+
+def test_inmemory_clear_missing_key() -> None:
+    backend = InMemoryBackend()
+    assert asyncio.run(backend.clear(key="missing:key")) == 0
+
+
+def test_inmemory_clear_namespace_includes_members(clock: List[int]) -> None:
+    backend = InMemoryBackend()
+
+    async def run() -> None:
+        await backend.set("cleared:value", b"x", 60)
+        await backend.append("cleared:invalidation:file:1", "cleared:value", 60)
+        await backend.set("kept:value", b"y", 60)
+
+        assert await backend.clear(namespace="cleared") == 2
+        assert await backend.get("cleared:value") is None
+        assert await backend.pop_members("cleared:invalidation:file:1") == set()
+        assert await backend.get("kept:value") == b"y"
+
+    asyncio.run(run())
+
+
+def test_inmemory_clear_many(clock: List[int]) -> None:
+    backend = InMemoryBackend()
+
+    async def run() -> None:
+        await backend.set("many:value", b"x", 60)
+        await backend.append("many:tag", "many:value", 60)
+        await backend.set("many:kept", b"y", 60)
+
+        assert await backend.clear_many("many:value", "many:tag", "many:missing") == 2
+        assert await backend.get("many:value") is None
+        assert await backend.pop_members("many:tag") == set()
+        assert await backend.get("many:kept") == b"y"
+        assert await backend.clear_many() == 0
+
+    asyncio.run(run())
+
+
+class DictBackend(Backend):
+    """Minimal backend relying on the Backend defaults for bulk operations"""
+
+    def __init__(self) -> None:
+        self.store: Dict[str, bytes] = {}
+
+    async def get_with_ttl(self, key: str) -> Tuple[int, Optional[bytes]]:
+        return -1, self.store.get(key)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.store.get(key)
+
+    async def set(self, key: str, value: bytes, expire: Optional[int] = None) -> None:
+        self.store[key] = value
+
+    async def clear(self, namespace: Optional[str] = None, key: Optional[str] = None) -> int:
+        return 1 if key is not None and self.store.pop(key, None) is not None else 0
+
+
+def test_default_clear_many() -> None:
+    backend = DictBackend()
+
+    async def run() -> None:
+        await backend.set("a", b"1")
+        await backend.set("b", b"2")
+        await backend.set("c", b"3")
+
+        assert await backend.clear_many("a", "b", "missing") == 2
+        assert backend.store == {"c": b"3"}
+
+    asyncio.run(run())
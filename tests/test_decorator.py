@@ -5,7 +5,7 @@ import pendulum
 import pytest
 from starlette.testclient import TestClient
 
-from examples.in_memory.main import app
+from examples.in_memory.main import app, files
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.inmemory import InMemoryBackend
 
@@ -135,3 +135,25 @@ def test_cache_control() -> None:
 
         response = client.get("/cached_put")
         assert response.json() == {"value": 2}
+
+
+def test_tag_invalidation(monkeypatch: pytest.MonkeyPatch) -> None:
+    # restore the example's file store once the test deletes from it
+    monkeypatch.setitem(files, 2, files[2])
+    with TestClient(app) as client:
+        response = client.get("/files")
+        assert response.headers.get("X-FastAPI-Cache") == "MISS"
+        assert {item["id"] for item in response.json()} == {1, 2, 3}
+
+        response = client.get("/files")
+        assert response.headers.get("X-FastAPI-Cache") == "HIT"
+
+        # invalidating an object the response does not contain keeps it cached
+        client.delete("/files/99")
+        response = client.get("/files")
+        assert response.headers.get("X-FastAPI-Cache") == "HIT"
+
+        client.delete("/files/2")
+        response = client.get("/files")
+        assert response.headers.get("X-FastAPI-Cache") == "MISS"
+        assert {item["id"] for item in response.json()} == {1, 3}
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from fastapi_cache.backends.redis import RedisBackend
+
+# fakeredis needs lupa to run the tag Lua scripts
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+
+def test_redis_append_never_shortens_ttl() -> None:
+    async def run() -> None:
+        redis = fakeredis.FakeAsyncRedis()
+        backend = RedisBackend(redis)
+
+        await backend.append("tag", "long", 300)
+        await backend.bulk_append([("tag", "short"), ("other", "short")], 5)
+        assert await redis.ttl("tag") == 300
+        assert await redis.ttl("other") == 5
+
+        # a longer expire still raises the ttl
+        await backend.append("other", "long", 300)
+        assert await redis.ttl("other") == 300
+
+    asyncio.run(run())
+
+
+def test_redis_append_without_expire_persists() -> None:
+    async def run() -> None:
+        redis = fakeredis.FakeAsyncRedis()
+        backend = RedisBackend(redis)
+
+        await backend.append("tag", "short", 5)
+        await backend.append("tag", "forever")
+        assert await redis.ttl("tag") == -1
+
+        # a persistent set is never given a ttl again
+        await backend.bulk_append([("tag", "short")], 5)
+        assert await redis.ttl("tag") == -1
+
+    asyncio.run(run())
+
+
+def test_redis_pop_members() -> None:
+    async def run() -> None:
+        redis = fakeredis.FakeAsyncRedis()
+        backend = RedisBackend(redis)
+
+        await backend.bulk_append([("tag", "key1"), ("tag", "key2")], 60)
+        assert await backend.pop_members("tag") == {"key1", "key2"}
+        assert not await redis.exists("tag")
+        assert await backend.pop_members("tag") == set()
+
+    asyncio.run(run())
+
+
+def test_redis_scripts_reload() -> None:
+    async def run() -> None:
+        redis = fakeredis.FakeAsyncRedis()
+        backend = RedisBackend(redis)
+
+        await redis.script_flush()
+        await backend.bulk_append([("tag", "key1")], 60)
+        await backend.append("tag", "key2", 60)
+        assert await backend.pop_members("tag") == {"key1", "key2"}
+
+    asyncio.run(run())
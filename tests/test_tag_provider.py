@@ -0,0 +1,150 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Generator, List
+
+import pytest
+
+from fastapi_cache import FastAPICache, decorator
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.decorator import cache_invalidator
+from fastapi_cache.tag_provider import TAG_BATCH_SIZE, TagProvider
+from fastapi_cache.types import Backend
+
+
+@pytest.fixture(autouse=True)
+def _init_cache() -> Generator[Any, Any, None]:  # pyright: ignore[reportUnusedFunction]
+    FastAPICache.init(InMemoryBackend(), prefix="tags")
+    yield
+    FastAPICache.reset()
+
+
+def test_cache_invalidator_unknown_param() -> None:
+    with pytest.raises(ValueError, match="no parameter named 'wrong'"):
+
+        @cache_invalidator(TagProvider("file"), "wrong")
+        async def delete_file(file_id: int) -> None:  # pyright: ignore[reportUnusedFunction]
+            ...
+
+
+def test_cache_invalidator_positional_id() -> None:
+    tag_provider = TagProvider("file")
+
+    @cache_invalidator(tag_provider, "file_id")
+    async def delete_file(file_id: int) -> None:
+        ...
+
+    async def run() -> None:
+        backend = FastAPICache.get_backend()
+        await backend.set("tags:positional", b"x", 60)
+        await tag_provider.provide({"id": 1}, "tags:positional", 60)
+        await delete_file(1)
+        assert await backend.get("tags:positional") is None
+
+    asyncio.run(run())
+
+
+def test_unsupported_backend() -> None:
+    class ValueOnlyBackend(InMemoryBackend):
+        append = Backend.append
+        pop_members = Backend.pop_members
+
+    FastAPICache.reset()
+    FastAPICache.init(ValueOnlyBackend(), prefix="tags")
+    tag_provider = TagProvider("file")
+    calls: List[int] = []
+
+    @cache_invalidator(tag_provider, "file_id")
+    async def delete_file(file_id: int) -> None:
+        calls.append(file_id)
+
+    async def run() -> None:
+        await delete_file(1)
+
+    with pytest.raises(NotImplementedError, match="ValueOnlyBackend does not support tags"):
+        asyncio.run(run())
+    # the check runs before the mutation
+    assert calls == []
+
+
+def test_tag_follows_prefix() -> None:
+    tag_provider = TagProvider("file")
+    assert tag_provider.get_tag(object_id="1") == "tags:invalidation:file:1"
+
+    FastAPICache.reset()
+    FastAPICache.init(InMemoryBackend(), prefix="other")
+    assert tag_provider.get_tag(object_id="1") == "other:invalidation:file:1"
+
+
+def test_default_id_fast_path_matches_custom_provider() -> None:
+    items = [{"id": 1}, {"id": "a"}, {"id": 2.5}, {"id": 1}]
+    fast = TagProvider("file")
+    custom = TagProvider("file", lambda item: str(item["id"]))  # pyright: ignore[reportUnknownLambdaType,reportUnknownArgumentType]
+
+    async def run() -> None:
+        backend = FastAPICache.get_backend()
+        await fast.provide(items, "tags:fast", 60)
+        await custom.provide(items, "tags:custom", 60)
+        tags = {fast.get_tag(item) for item in items}
+        assert tags == {custom.get_tag(item) for item in items}
+        for tag in tags:
+            assert await backend.pop_members(tag) == {"tags:fast", "tags:custom"}
+
+    asyncio.run(run())
+
+
+def test_provide_batches() -> None:
+    # ids repeat across batches, and the last batch is partial
+    items = [{"id": i % 300} for i in range(TAG_BATCH_SIZE * 2 + 10)]
+    tag_provider = TagProvider("file")
+
+    async def run() -> None:
+        backend = FastAPICache.get_backend()
+        await tag_provider.provide(items, "tags:batched", 60)
+        for object_id in range(300):
+            tag = tag_provider.get_tag(object_id=str(object_id))
+            assert await backend.pop_members(tag) == {"tags:batched"}
+
+    asyncio.run(run())
+
+
+def _background_invalidator(tag_provider: TagProvider) -> Callable[..., Awaitable[None]]:
+    @cache_invalidator(tag_provider, "file_id", background=True)
+    async def delete_file(file_id: int) -> None:
+        ...
+
+    return delete_file
+
+
+def test_cache_invalidator_background() -> None:
+    tag_provider = TagProvider("file")
+    delete_file = _background_invalidator(tag_provider)
+
+    async def run() -> None:
+        backend = FastAPICache.get_backend()
+        await backend.set("tags:background", b"x", 60)
+        await tag_provider.provide({"id": 1}, "tags:background", 60)
+
+        await delete_file(file_id=1)
+        # scheduled, but not yet run
+        assert await backend.get("tags:background") == b"x"
+        await asyncio.gather(*decorator._background_invalidations)  # pyright: ignore[reportPrivateUsage]
+        assert await backend.get("tags:background") is None
+
+    asyncio.run(run())
+
+
+def test_cache_invalidator_background_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(decorator, "MAX_BACKGROUND_INVALIDATIONS", 0)
+    tag_provider = TagProvider("file")
+    delete_file = _background_invalidator(tag_provider)
+
+    async def run() -> None:
+        backend = FastAPICache.get_backend()
+        await backend.set("tags:inline", b"x", 60)
+        await tag_provider.provide({"id": 1}, "tags:inline", 60)
+
+        # over the limit, the invalidation runs inline
+        await delete_file(file_id=1)
+        assert not decorator._background_invalidations  # pyright: ignore[reportPrivateUsage]
+        assert await backend.get("tags:inline") is None
+
+    asyncio.run(run())